@@ -0,0 +1,41 @@
+import numpy as np
+from numba import njit, prange
+
+from emrp_model import calculate_metrics
+
+# ------------------- Batch Kernels -------------------
+# Compiled from the same function the app uses, so the sweep cannot drift from it
+_metrics = njit(cache=True)(calculate_metrics)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def emrp_batch(freq, emf, envf, mci, bvi, hs):
+    for i in prange(freq.shape[0]):
+        m, b, h = _metrics(freq[i], emf[i], envf[i])
+        mci[i] = m
+        bvi[i] = b
+        hs[i] = h
+
+def emrp_sweep(freq, emf, envf):
+    freq = np.ascontiguousarray(freq, dtype=np.float64)
+    emf = np.ascontiguousarray(emf, dtype=np.float64)
+    envf = np.ascontiguousarray(envf, dtype=np.float64)
+    if not (freq.ndim == emf.ndim == envf.ndim == 1 and freq.shape == emf.shape == envf.shape):
+        raise ValueError(
+            "freq, emf and envf must be 1-D arrays of equal length, "
+            f"got shapes {freq.shape}, {emf.shape} and {envf.shape}"
+        )
+    mci = np.empty_like(freq)
+    bvi = np.empty_like(freq)
+    hs = np.empty_like(freq)
+    emrp_batch(freq, emf, envf, mci, bvi, hs)
+    return mci, bvi, hs
+
+if __name__ == "__main__":
+    # Check the compiled sweep against the scalar model on a grid of inputs
+    grid = np.stack(np.meshgrid(
+        np.linspace(0.0, 15.0, 61), np.linspace(0.0, 1.0, 11), np.linspace(0.0, 1.0, 11)
+    ), axis=-1).reshape(-1, 3)
+    swept = np.column_stack(emrp_sweep(grid[:, 0], grid[:, 1], grid[:, 2]))
+    expected = np.array([calculate_metrics(*row) for row in grid])
+    np.testing.assert_allclose(swept, expected, rtol=1e-9, atol=1e-12)
+    print(f"emrp_sweep matches calculate_metrics on {len(grid)} inputs")
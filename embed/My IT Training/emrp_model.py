@@ -0,0 +1,11 @@
+# ------------------- Constants -------------------
+SCHUMANN_RESONANCE = 7.83
+MAX_FREQ_TOLERANCE = 2.5
+
+# ------------------- Core Functions -------------------
+def calculate_metrics(freq, emf, env_factor):
+    m = max(0.0, 1.0 - abs(freq - SCHUMANN_RESONANCE) / MAX_FREQ_TOLERANCE) * (1.0 - emf)
+    m = min(1.0, max(0.0, m))
+    b = m * m
+    h = min(1.0, max(0.0, 0.5 * m + 0.4 * b + 0.1 * env_factor))
+    return m, b, h
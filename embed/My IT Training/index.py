@@ -1,39 +1,41 @@
+import io
+
 import streamlit as st
-import matplotlib.pyplot as plt
 import pandas as pd
 
-# ------------------- Constants -------------------
-SCHUMANN_RESONANCE = 7.83
-MAX_FREQ_TOLERANCE = 2.5
-
-# ------------------- Core Functions -------------------
-def clamp(value, min_value=0.0, max_value=1.0):
-    return max(min(value, max_value), min_value)
-
-def calculate_MCI(freq, emf):
-    diff = abs(freq - SCHUMANN_RESONANCE)
-    score = 1 - (diff / MAX_FREQ_TOLERANCE) if diff <= MAX_FREQ_TOLERANCE else 0
-    return clamp(score * (1 - emf))
-
-def calculate_BVI(MCI):
-    return clamp(MCI ** 2)
-
-def calculate_HS(MCI, BVI, env_factor):
-    return clamp(0.5 * MCI + 0.4 * BVI + 0.1 * env_factor)
-
-def generate_results(custom_input):
-    presets = [
-        {"Environment": "Earth", "Frequency": 7.83, "EMF": 0.2, "Env Factor": 0.9},
-        {"Environment": "Mars", "Frequency": 2.1, "EMF": 0.05, "Env Factor": 0.3},
-        {"Environment": "EMRP Bubble", "Frequency": 7.8, "EMF": 0.01, "Env Factor": 1.0},
-        {"Environment": "Urban Earth", "Frequency": 6.9, "EMF": 0.6, "Env Factor": 0.7},
-        {"Environment": "Custom Input", **custom_input}
-    ]
-    for env in presets:
-        env["MCI"] = calculate_MCI(env["Frequency"], env["EMF"])
-        env["BVI"] = calculate_BVI(env["MCI"])
-        env["HS"] = calculate_HS(env["MCI"], env["BVI"], env["Env Factor"])
-    return pd.DataFrame(presets)
+from emrp_model import calculate_metrics
+
+# ------------------- Presets -------------------
+_PRESETS = (
+    ("Earth", 7.83, 0.2, 0.9),
+    ("Mars", 2.1, 0.05, 0.3),
+    ("EMRP Bubble", 7.8, 0.01, 1.0),
+    ("Urban Earth", 6.9, 0.6, 0.7),
+)
+
+# Preset metrics never change, so compute them once at import time.
+_PRESET_ROWS = [(name, f, e, ev, *calculate_metrics(f, e, ev)) for name, f, e, ev in _PRESETS]
+_PRESET_RESULTS = {
+    col: [row[i] for row in _PRESET_ROWS]
+    for i, col in enumerate(("Environment", "Frequency", "EMF", "Env Factor", "MCI", "BVI", "HS"))
+}
+METRICS = ("MCI", "BVI", "HS")
+
+@st.cache_data(max_entries=512)
+def generate_results(freq: float, emf: float, env_factor: float):
+    mci, bvi, hs = calculate_metrics(freq, emf, env_factor)
+    custom = {
+        "Environment": "Custom Input", "Frequency": freq, "EMF": emf, "Env Factor": env_factor,
+        "MCI": mci, "BVI": bvi, "HS": hs,
+    }
+    results = {col: values + [custom[col]] for col, values in _PRESET_RESULTS.items()}
+    return results, (mci, bvi, hs)
+
+@st.cache_data(max_entries=512)
+def df_to_csv_bytes(freq: float, emf: float, env_factor: float):
+    buf = io.BytesIO()
+    pd.DataFrame(generate_results(freq, emf, env_factor)[0]).to_csv(buf, index=False)
+    return buf.getvalue()
 
 # ------------------- Streamlit App Setup -------------------
 st.set_page_config("EMRP Simulator", layout="wide")
@@ -50,67 +52,57 @@ with tabs[0]:
     """)
 
     st.sidebar.header("🧪 Custom Environment Input")
-    freq = st.sidebar.slider("Resonance Frequency (Hz)", 0.0, 15.0, 7.83, 0.01)
-    emf = st.sidebar.slider("EMF Noise Level", 0.0, 1.0, 0.2, 0.01)
-    env_factor = st.sidebar.slider("Environmental Factor", 0.0, 1.0, 0.9, 0.01)
+    with st.sidebar.form("params"):
+        freq = st.slider("Resonance Frequency (Hz)", 0.0, 15.0, 7.83, 0.01)
+        emf = st.slider("EMF Noise Level", 0.0, 1.0, 0.2, 0.01)
+        env_factor = st.slider("Environmental Factor", 0.0, 1.0, 0.9, 0.01)
+        submitted = st.form_submit_button("Update")
 
-    custom_input = {"Frequency": freq, "EMF": emf, "Env Factor": env_factor}
-    df = generate_results(custom_input)
-    custom = df[df["Environment"] == "Custom Input"].iloc[0]
+    # Sliders only commit on submit, so recompute once per update rather than per drag tick
+    if submitted or "results" not in st.session_state:
+        st.session_state.results = generate_results(freq, emf, env_factor)
+    results, (mci, bvi, hs) = st.session_state.results
 
     col1, col2, col3 = st.columns(3)
     with col1:
         st.markdown("### 🧲 MCI")
-        st.markdown(f"**{custom.MCI:.2f}**")
+        st.markdown(f"**{mci:.2f}**")
         st.info("Magnetic Coherence Index:\nHow closely this frequency aligns with Earth's natural 7.83 Hz resonance.")
 
     with col2:
         st.markdown("### 🧬 BVI")
-        st.markdown(f"**{custom.BVI:.2f}**")
+        st.markdown(f"**{bvi:.2f}**")
         st.info("Biological Viability Index:\nLife-support potential derived from MCI².")
 
     with col3:
         st.markdown("### 🌱 HS")
-        st.markdown(f"**{custom.HS:.2f}**")
+        st.markdown(f"**{hs:.2f}**")
         st.info("Habitability Score:\nCombined metric from MCI, BVI, and environment.")
 
     st.markdown("---")
     st.subheader("📁 Preset + Custom Simulation Results")
-    st.dataframe(df.style.format({"MCI": "{:.2f}", "BVI": "{:.2f}", "HS": "{:.2f}"}), use_container_width=True)
+    display = {col: [round(v, 2) for v in results[col]] if col in METRICS else results[col] for col in results}
+    st.dataframe(display, use_container_width=True)
 
 # ------------------- Tab 2: Charts -------------------
 with tabs[1]:
     st.subheader("📉 Visual Comparison")
 
-    env_names = df["Environment"]
-    mci_vals = df["MCI"]
-    bvi_vals = df["BVI"]
-    hs_vals = df["HS"]
-
-    fig, ax = plt.subplots(figsize=(10, 5))
-    x = range(len(env_names))
-    bar_width = 0.25
-
-    ax.bar([p - bar_width for p in x], mci_vals, width=bar_width, label='MCI', color='royalblue')
-    ax.bar(x, bvi_vals, width=bar_width, label='BVI', color='seagreen')
-    ax.bar([p + bar_width for p in x], hs_vals, width=bar_width, label='HS', color='darkorange')
-
-    ax.set_xticks(x)
-    ax.set_xticklabels(env_names, rotation=15)
-    ax.set_ylim(0, 1.05)
-    ax.set_ylabel("Score (0–1)")
-    ax.set_title("EMRP Comparison: MCI, BVI, HS")
-    ax.legend()
-
-    st.pyplot(fig)
+    long_data = {
+        "Environment": results["Environment"] * len(METRICS),
+        "Metric": [m for m in METRICS for _ in results["Environment"]],
+        "Score": [v for m in METRICS for v in results[m]],
+    }
+    st.markdown("#### EMRP Comparison: MCI, BVI, HS")
+    st.bar_chart(long_data, x="Environment", y="Score", color="Metric", stack=False, y_label="Score (0–1)")
 
     st.markdown("### 📈 Line Chart of Habitability Scores")
-    st.line_chart(df.set_index("Environment")[["MCI", "BVI", "HS"]])
+    st.line_chart(results, x="Environment", y=list(METRICS))
 
 # ------------------- Tab 3: Download -------------------
 with tabs[2]:
     st.subheader("📥 Export Results")
-    csv = df.to_csv(index=False).encode('utf-8')
+    csv = df_to_csv_bytes(freq, emf, env_factor)
     st.download_button(
         "⬇️ Download as CSV",
         data=csv,
@@ -152,8 +144,9 @@ Edit
 ### 🛠️ Technologies Used
 - Python 3.11
 - Streamlit
-- Matplotlib
 - Pandas
+- NumPy
+- Numba (optional, for batch parameter sweeps in emrp_kernels.py)
 
 ### 📚 Final Year Research Project
 **By:** *Ediongsenyene Amos*  
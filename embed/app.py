@@ -2,12 +2,8 @@
 # Developed by Ediongsenyene Amos
 
 import streamlit as st
-import matplotlib.pyplot as plt
-import plotly.express as px
+import numpy as np
 import pandas as pd
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-import base64
 import io
 
 # EMRP Metric Calculation Functions
@@ -20,8 +16,40 @@ def calculate_bvi(mcr, atmospheric_pressure):
 def calculate_gei(solar_flux):
     return round(100 - (solar_flux / 10), 2)
 
+@st.cache_data(max_entries=512)
+def run_sim(mf: float, ap: float, sf: float):
+    mcr = calculate_mcr(mf)
+    return mcr, calculate_bvi(mcr, ap), calculate_gei(sf)
+
+# Heavy libraries are loaded on first use and shared across sessions
+@st.cache_resource
+def _plotly():
+    import plotly.express as px
+    return px
+
+@st.cache_resource
+def _reportlab():
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    return canvas, A4
+
+@st.cache_resource(max_entries=512)
+def make_radar(mcr, bvi, gei):
+    px = _plotly()
+    return px.line_polar(
+        r=[mcr, bvi, gei, mcr],
+        theta=['MCR', 'BVI', 'GEI', 'MCR'],
+        line_close=True,
+        title="Magnetic Rhythm Metrics Radar Chart"
+    )
+
 # PDF Report Generator Function
+# Cached on hashable inputs (inputs passed as a tuple of items) so identical runs skip ReportLab
+@st.cache_data(max_entries=512)
 def generate_pdf(mcr, bvi, gei, planet, inputs):
+    canvas, A4 = _reportlab()
+    inputs = dict(inputs)
+
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=A4)
     textobject = c.beginText(50, 800)
@@ -39,16 +67,33 @@ def generate_pdf(mcr, bvi, gei, planet, inputs):
     c.drawText(textobject)
     c.showPage()
     c.save()
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 # Streamlit App Start
 st.set_page_config(page_title="Planet Magnetic Rhythm Simulator", layout="centered")
 st.title('🌍 Planet Magnetic Rhythm Simulation System (EMRP)')
 
+MAX_STORED_RESULTS = 500
+RESULT_DTYPE = [
+    ("Planet", "U20"),
+    ("mf", np.float64),
+    ("ap", np.float64),
+    ("sf", np.float64),
+    ("MCR", np.float64),
+    ("BVI", np.float64),
+    ("GEI", np.float64),
+]
+RESULT_COLUMNS = {
+    "mf": "Magnetic Field Strength (µT)",
+    "ap": "Atmospheric Pressure (Pa)",
+    "sf": "Solar Flux (W/m²)",
+}
+
 # Initialize session state to store all simulations
-if "simulation_results" not in st.session_state:
-    st.session_state.simulation_results = []
+if "results_head" not in st.session_state:
+    st.session_state.simulation_results = np.zeros(MAX_STORED_RESULTS, dtype=RESULT_DTYPE)
+    st.session_state.results_count = 0
+    st.session_state.results_head = 0
 
 # Planet Selection
 planet = st.selectbox("Select Planet:", ["Earth", "Mars", "Custom Planet"])
@@ -77,52 +122,63 @@ inputs = {
 # Run Simulation Button
 if st.button("Run Simulation"):
 
-    mcr = calculate_mcr(magnetic_field)
-    bvi = calculate_bvi(mcr, atmospheric_pressure)
-    gei = calculate_gei(solar_flux)
-
-    st.success(f"MCR: {mcr}")
-    st.success(f"BVI: {bvi}")
-    st.success(f"GEI: {gei}")
+    mcr, bvi, gei = run_sim(magnetic_field, atmospheric_pressure, solar_flux)
 
     # Store in session state
-    st.session_state.simulation_results.append({
-        "Planet": planet,
-        "Magnetic Field Strength (µT)": magnetic_field,
-        "Atmospheric Pressure (Pa)": atmospheric_pressure,
-        "Solar Flux (W/m²)": solar_flux,
-        "MCR": mcr,
-        "BVI": bvi,
-        "GEI": gei
-    })
+    # Ring buffer: once full, the newest simulation overwrites the oldest in place
+    results = st.session_state.simulation_results
+    n = st.session_state.results_count
+    head = st.session_state.results_head
+    if n == MAX_STORED_RESULTS:
+        slot = head
+        st.session_state.results_head = (head + 1) % MAX_STORED_RESULTS
+    else:
+        slot = (head + n) % MAX_STORED_RESULTS
+        st.session_state.results_count = n + 1
+    results[slot] = (planet, magnetic_field, atmospheric_pressure, solar_flux, mcr, bvi, gei)
+
+    new_df = pd.DataFrame(results[slot:slot + 1]).rename(columns=RESULT_COLUMNS)
+    if n:
+        new_df = pd.concat([st.session_state.results_df, new_df], ignore_index=True).tail(MAX_STORED_RESULTS)
+    st.session_state.results_df = new_df
+    st.session_state.last_run = (mcr, bvi, gei, planet, tuple(inputs.items()))
+
+# Display Latest Simulation
+# Rendered from session state so the outputs survive the rerun triggered by a download click,
+# but dropped as soon as the planet or inputs no longer match the run they came from
+if "last_run" in st.session_state and st.session_state.last_run[3:] != (planet, tuple(inputs.items())):
+    del st.session_state.last_run
+
+if "last_run" in st.session_state:
+    mcr, bvi, gei, run_planet, run_inputs = st.session_state.last_run
+
+    st.success(f"**MCR:** {mcr}  \n**BVI:** {bvi}  \n**GEI:** {gei}")
 
     # Display Radar Chart
-    fig = px.line_polar(
-        r=[mcr, bvi, gei, mcr],
-        theta=['MCR', 'BVI', 'GEI', 'MCR'],
-        line_close=True,
-        title="Magnetic Rhythm Metrics Radar Chart"
-    )
-    st.plotly_chart(fig)
+    st.plotly_chart(make_radar(mcr, bvi, gei))
 
     # Generate PDF Report
-    pdf_buffer = generate_pdf(mcr, bvi, gei, planet, inputs)
-    b64_pdf = base64.b64encode(pdf_buffer.read()).decode()
-    href_pdf = f'<a href="data:application/octet-stream;base64,{b64_pdf}" download="simulation_report.pdf">📄 Download PDF Report</a>'
-    st.markdown(href_pdf, unsafe_allow_html=True)
+    pdf_bytes = generate_pdf(mcr, bvi, gei, run_planet, run_inputs)
+    st.download_button(
+        "📄 Download PDF Report",
+        data=pdf_bytes,
+        file_name="simulation_report.pdf",
+        mime="application/pdf"
+    )
 
     # Display success message
-    st.info("PDF Report is ready. Click the link above to download.")
+    st.info("PDF Report is ready. Click the button above to download.")
 
 # Display Stored Results (Session State)
-if st.session_state.simulation_results:
+if st.session_state.results_count:
     st.subheader("🗃️ All Simulations This Session")
-    df = pd.DataFrame(st.session_state.simulation_results)
+    df = st.session_state.results_df
     st.dataframe(df)
 
     # CSV Export
-    csv_buffer = io.StringIO()
-    df.to_csv(csv_buffer, index=False)
-    b64_csv = base64.b64encode(csv_buffer.getvalue().encode()).decode()
-    href_csv = f'<a href="data:file/csv;base64,{b64_csv}" download="all_simulations.csv">📥 Download All Results as CSV</a>'
-    st.markdown(href_csv, unsafe_allow_html=True)
+    st.download_button(
+        "📥 Download All Results as CSV",
+        data=df.to_csv(index=False).encode(),
+        file_name="all_simulations.csv",
+        mime="text/csv"
+    )